@@ -1,18 +1,12 @@
 import os
 import sys
-import cv2
-import numpy as np
-from OpenGL.raw.GLUT import glutPostRedisplay
-from cvzone.HandTrackingModule import HandDetector
 from monitor import SystemMonitor  # system-level CPU/RAM logger
 
+import multiprocessing
 import threading
 import queue
 import time
 
-from src.controllers.hand_controller import HandTrackingController
-from src.rendering.cube_renderer import CubeRenderer
-
 
 global_mode = {"mode": 3}   # 1=RAW, 2=SMOOTH, 3=KALMAN
 
@@ -26,6 +20,17 @@ def resource_path(rel_path: str) -> str:
 
 
 def main():
+    # import berat (OpenCV, mediapipe, PyOpenGL) sengaja di sini, bukan di
+    # top-level: proses SystemMonitor (spawn) meng-import ulang main.py
+    # sebagai __mp_main__ dan tidak butuh semua ini
+    import cv2
+    import numpy as np
+    from OpenGL.raw.GLUT import glutPostRedisplay
+    from cvzone.HandTrackingModule import HandDetector
+
+    from src.controllers.hand_controller import HandTrackingController
+    from src.rendering.cube_renderer import CubeRenderer
+
     # ================== START SYSTEM MONITOR ==================
     monitor = SystemMonitor(
         interval_sec=1.0,
@@ -273,4 +278,6 @@ def main():
         monitor.stop()
 
 if __name__ == "__main__":
+    # SystemMonitor pakai multiprocessing; wajib untuk build PyInstaller di Windows
+    multiprocessing.freeze_support()
     main()
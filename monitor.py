@@ -1,7 +1,7 @@
 import os
 import time
 import csv
-import threading
+import multiprocessing as mp
 import psutil
 
 
@@ -10,65 +10,112 @@ class SystemMonitor:
         self,
         interval_sec: float = 1.0,
         csv_path: str = "system_benchmark.csv",
+        flush_every: int = 10,
+        mem_every: int | None = None,
     ):
         self.interval_sec = interval_sec
         self.csv_path = csv_path
-        self._stop = threading.Event()
-        self._thread = None
+        # flush ke disk tiap N sampel (bukan tiap sampel)
+        self.flush_every = max(1, flush_every)
+        # RAM total sistem berubah pelan: baca virtual_memory() tiap N sampel
+        # saja; default-nya kira-kira 10x per detik (tiap sampel kalau >= 0.1 s)
+        if mem_every is None:
+            mem_every = int(0.1 / interval_sec) if interval_sec > 0 else 1
+        self._mem_every = max(1, mem_every)
+        self._stop = mp.Event()
+        self._proc = None
 
     def start(self):
-        if self._thread is not None:
+        if self._proc is not None:
             return
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        # sampler jalan di proses terpisah supaya tidak rebutan GIL dengan
+        # render/tracking loop yang justru sedang diukur
+        self._proc = mp.Process(
+            target=_run_worker,
+            args=(
+                os.getpid(),
+                self.interval_sec,
+                self.csv_path,
+                self.flush_every,
+                self._mem_every,
+                self._stop,
+            ),
+            daemon=True,
+        )
+        self._proc.start()
 
     def stop(self):
         self._stop.set()
-        if self._thread is not None:
-            self._thread.join(timeout=2.0)
+        if self._proc is not None:
+            self._proc.join(timeout=2.0)
+            if self._proc.is_alive():
+                self._proc.terminate()
 
-    def _run(self):
-        proc = psutil.Process(os.getpid())
-        fieldnames = [
-            "time_sec",
-            "cpu_total_percent",
-            "cpu_proc_percent",
-            "mem_total_percent",
-            "mem_proc_mb",
-        ]
 
-        t0 = time.perf_counter()
+def _run_worker(
+    pid: int,
+    interval_sec: float,
+    csv_path: str,
+    flush_every: int,
+    mem_every: int,
+    stop_event,
+):
+    """Loop sampling CPU/RAM untuk proses pid, ditulis ke csv_path."""
+    proc = psutil.Process(pid)
+    fieldnames = [
+        "time_sec",
+        "cpu_total_percent",
+        "cpu_proc_percent",
+        "mem_total_percent",
+        "mem_proc_mb",
+    ]
 
-        # warm up cpu_percent
-        psutil.cpu_percent(interval=None)
-        proc.cpu_percent(interval=None)
+    t0 = time.perf_counter()
 
-        with open(self.csv_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+    # warm up cpu_percent
+    psutil.cpu_percent(interval=None)
+    proc.cpu_percent(interval=None)
 
-            while not self._stop.is_set():
-                now = time.perf_counter()
-                elapsed = now - t0
+    rss_to_mb = 1.0 / (1024 * 1024)
+    n = 0
+    k = 0
 
-                cpu_total = psutil.cpu_percent(interval=None)  # semua core
-                cpu_proc = proc.cpu_percent(interval=None)      # proses ini
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+
+        while not stop_event.is_set():
+            now = time.perf_counter()
+            elapsed = now - t0
+
+            cpu_total = psutil.cpu_percent(interval=None)  # semua core
+            if n % mem_every == 0:
                 mem = psutil.virtual_memory()
-                mem_total = mem.percent
-                mem_proc_mb = proc.memory_info().rss / (1024 * 1024)
+            # oneshot: info proses dibaca sekali dari OS untuk dua query
+            try:
+                with proc.oneshot():
+                    cpu_proc = proc.cpu_percent(interval=None)  # proses utama
+                    mem_proc_mb = proc.memory_info().rss * rss_to_mb
+            except psutil.NoSuchProcess:
+                # proses utama sudah mati tanpa sempat stop()
+                break
 
-                writer.writerow(
-                    {
-                        "time_sec": elapsed,
-                        "cpu_total_percent": cpu_total,
-                        "cpu_proc_percent": cpu_proc,
-                        "mem_total_percent": mem_total,
-                        "mem_proc_mb": mem_proc_mb,
-                    }
-                )
+            writer.writerow(
+                (elapsed, cpu_total, cpu_proc, mem.percent, mem_proc_mb)
+            )
 
-                # flush supaya aman kalau crash
+            # flush berkala supaya aman kalau crash
+            n += 1
+            if n % flush_every == 0:
                 f.flush()
 
-                # tidur sampai sampling berikutnya
-                time.sleep(self.interval_sec)
+            # tidur sampai deadline absolut berikutnya (t0 + k*interval_sec),
+            # jadi durasi pengukuran tidak menumpuk jadi drift
+            k += 1
+            slack = t0 + k * interval_sec - time.perf_counter()
+            if slack < 0.0 and interval_sec > 0.0:
+                # telat lebih dari 1 interval: lompat ke slot berikutnya
+                k = int((time.perf_counter() - t0) / interval_sec) + 1
+                slack = t0 + k * interval_sec - time.perf_counter()
+            # wait() langsung bangun kalau stop() dipanggil
+            stop_event.wait(timeout=max(0.0, slack))
@@ -1,5 +1,7 @@
+import ctypes
 from typing import Dict
 
+import numpy as np
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
@@ -14,19 +16,26 @@ class CubeRenderer:
         self.roty: float = 0.0
         self.scale: float = 4.0  # default, nanti dikali gesture
 
-        # display list id
-        self.gllist: int | None = None
+        # VBO (interleaved pos/normal/uv) + index buffer
+        self.vbo: int | None = None
+        self.ibo: int | None = None
+        self.indexcount: int = 0
+        # (texture id, index awal, jumlah index) per material, urut material
+        self.drawranges: list[tuple[int | None, int, int]] = []
 
         # geometry
-        self.vertices: list[tuple[float, float, float]] = []
-        self.faces: list[list[int]] = []
-        self.facecolors: list[tuple[float, float, float]] = []
-        self.facenormals: list[tuple[float, float, float]] = []
+        self.vertices_np: np.ndarray = np.zeros((0, 3), dtype=np.float32)
+        self.facecount: int = 0
 
         # texturing data
-        self.texcoords: list[tuple[float, float]] = []
-        self.facetexcoords: list[list[int]] = []
-        self.facematerials: list[str | None] = []
+        self.texcoords_np: np.ndarray = np.zeros((0, 2), dtype=np.float32)
+
+        # hasil triangulasi (dari OBJLoader)
+        self.tri_indices: np.ndarray = np.zeros((0, 3), dtype=np.int32)
+        self.tri_uv_indices: np.ndarray = np.zeros((0, 3), dtype=np.int32)
+        self.tri_normals: np.ndarray = np.zeros((0, 3), dtype=np.float32)
+        self.tri_materials: np.ndarray = np.zeros(0, dtype=np.int32)
+        self.materialnames: list[str | None] = [None]
 
         # material -> texture path (dari OBJLoader)
         self.materialtexturepaths: Dict[str, str] = {}
@@ -40,25 +49,24 @@ class CubeRenderer:
             print(f"[CubeRenderer] CENTROID: ({cx:.2f}, {cy:.2f}, {cz:.2f})")
 
             # geser vertex supaya pusat objek di (0,0,0)
-            self.vertices = [
-                (v[0] - cx, v[1] - cy, v[2] - cz) for v in loader.vertices
-            ]
-            self.faces = loader.faces
-            self.facecolors = loader.facecolors
-            self.facenormals = loader.facenormals
-            self.texcoords = loader.texcoords
-            self.facetexcoords = loader.facetexcoords
-            self.facematerials = loader.facematerials
+            self.vertices_np = loader.vertices_np - np.float32((cx, cy, cz))
+            self.facecount = len(loader.facecounts)
+            self.texcoords_np = loader.texcoords_np
             self.materialtexturepaths = loader.materialtexturepaths
+            self.tri_indices = loader.tri_indices
+            self.tri_uv_indices = loader.tri_uv_indices
+            self.tri_normals = loader.tri_normals
+            self.tri_materials = loader.tri_materials
+            self.materialnames = loader.materialnames
 
             print("[CubeRenderer] vertices shifted by centroid")
             print(
                 f"[CubeRenderer] mesh loaded: "
-                f"{len(self.vertices)} vertices, {len(self.faces)} faces"
+                f"{len(self.vertices_np)} vertices, {self.facecount} faces"
             )
         else:
             # fallback cube
-            self.vertices = [
+            self.vertices_np = np.array([
                 (-1, -1, -1),
                 (1, -1, -1),
                 (1, 1, -1),
@@ -67,8 +75,8 @@ class CubeRenderer:
                 (1, -1, 1),
                 (1, 1, 1),
                 (-1, 1, 1),
-            ]
-            self.faces = [
+            ], dtype=np.float32)
+            faces = [
                 [0, 1, 2, 3],
                 [4, 5, 6, 7],
                 [0, 1, 5, 4],
@@ -76,14 +84,18 @@ class CubeRenderer:
                 [1, 2, 6, 5],
                 [0, 3, 7, 4],
             ]
-            self.facecolors = [(0.7, 0.7, 1.0)] * len(self.faces)
-            self.facenormals = [(0.0, 0.0, 1.0)] * len(self.faces)
-            self.texcoords = []
-            self.facetexcoords = []
-            self.facematerials = [None] * len(self.faces)
+            self.facecount = len(faces)
+
+            counts = [len(f) for f in faces]
+            faceid, corners = OBJLoader.fantriangulate(counts)
+            flatv = np.asarray([v for f in faces for v in f], dtype=np.int32)
+            self.tri_indices = flatv[corners]
+            self.tri_uv_indices = np.full(self.tri_indices.shape, -1, dtype=np.int32)
+            self.tri_normals = np.tile(np.float32((0.0, 0.0, 1.0)), (faceid.size, 1))
+            self.tri_materials = np.zeros(faceid.size, dtype=np.int32)
             print(
-                f"[CubeRenderer] mesh loaded: {len(self.vertices)} vertices, "
-                f"{len(self.faces)} faces"
+                f"[CubeRenderer] mesh loaded: {len(self.vertices_np)} vertices, "
+                f"{self.facecount} faces"
             )
 
     def updatestate(self, rotx: float, roty: float, scale: float) -> None:
@@ -121,30 +133,51 @@ class CubeRenderer:
 
         # ---------- BUILD TEXTURES ----------
         self.materialtextures = {}
+        # texture path -> id; material dengan file sama pakai satu texture,
+        # jadi range-nya bisa digabung di drawranges
+        texturebypath: Dict[str, int] = {}
         for name, texpath in self.materialtexturepaths.items():
+            if texpath in texturebypath:
+                self.materialtextures[name] = texturebypath[texpath]
+                continue
             if not os.path.exists(texpath):
                 print(f"[CubeRenderer] texture not found: {texpath}")
                 continue
             try:
-                img = Image.open(texpath).convert("RGBA")
+                img = Image.open(texpath)
+                # JPG (RGB) di-upload apa adanya, tanpa convert ke RGBA dulu;
+                # flip vertikal tetap dikerjakan encoder raw PIL sambil menyalin
+                if img.mode not in ("RGB", "RGBA"):
+                    img = img.convert("RGBA")
+                glformat = GL_RGBA if img.mode == "RGBA" else GL_RGB
                 w, h = img.size
-                data = img.tobytes("raw", "RGBA", 0, -1)
+                data = img.tobytes("raw", img.mode, 0, -1)
 
                 texid = glGenTextures(1)
                 glBindTexture(GL_TEXTURE_2D, texid)
-                glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+                glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
                 glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
                 glTexImage2D(
                     GL_TEXTURE_2D,
                     0,
-                    GL_RGBA,
+                    glformat,
                     w,
                     h,
                     0,
-                    GL_RGBA,
+                    glformat,
                     GL_UNSIGNED_BYTE,
                     data,
                 )
+
+                # mipmap supaya model yang di-scale kecil sampling level kasar
+                # (glGenerateMipmap butuh GL 3.0 / ARB_framebuffer_object)
+                if bool(glGenerateMipmap):
+                    glGenerateMipmap(GL_TEXTURE_2D)
+                    minfilter = GL_LINEAR_MIPMAP_LINEAR
+                else:
+                    minfilter = GL_LINEAR
+                glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, minfilter)
+                texturebypath[texpath] = texid
                 self.materialtextures[name] = texid
                 print(f"[CubeRenderer] texture loaded {texpath} -> id {texid}")
             except Exception as e:
@@ -155,53 +188,78 @@ class CubeRenderer:
         else:
             glDisable(GL_TEXTURE_2D)
 
-        if self.gllist is not None:
-            glDeleteLists(self.gllist, 1)
-        self.gllist = glGenLists(1)
-
-        glNewList(self.gllist, GL_COMPILE)
-
-        current_texid = None
-        if self.materialtextures:
-            current_texid = next(iter(self.materialtextures.values()))
-            glBindTexture(GL_TEXTURE_2D, current_texid)
-
-        glBegin(GL_TRIANGLES)
-        for face_idx, (verts, normal) in enumerate(
-            zip(self.faces, self.facenormals)
-        ):
-            if len(verts) < 3:
-                continue
-
-            glColor3f(1.0, 1.0, 1.0)
-            glNormal3f(*normal)
-
-            uvidx_list = (
-                self.facetexcoords[face_idx]
-                if face_idx < len(self.facetexcoords)
-                else []
+        # ---------- BUILD VBO ----------
+        vertexdata, indices, materialranges = self.buildmesharrays()
+
+        if self.vbo is not None:
+            glDeleteBuffers(2, [self.vbo, self.ibo])
+            self.vbo = self.ibo = None
+        self.indexcount = int(indices.size)
+
+        if self.indexcount:
+            self.vbo, self.ibo = (int(b) for b in glGenBuffers(2))
+            glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+            glBufferData(GL_ARRAY_BUFFER, vertexdata.nbytes, vertexdata, GL_STATIC_DRAW)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+            print(
+                f"[CubeRenderer] VBO uploaded: {len(vertexdata)} vertices, "
+                f"{self.indexcount} indices"
             )
 
-            v0 = verts[0]
-            for i in range(1, len(verts) - 1):
-                v1 = verts[i]
-                v2 = verts[i + 1]
-
-                for j, vidx in enumerate((v0, v1, v2)):
-                    uvidx = uvidx_list[j] if len(uvidx_list) > j else -1
-                    x, y, z = self.vertices[vidx]
-                    if 0 <= uvidx < len(self.texcoords):
-                        u, v = self.texcoords[uvidx]
-                        glTexCoord2f(u, v)
-                    glVertex3f(x, y, z)
-        glEnd()
-
-        glEndList()
-
-        # cek error SETELAH display list selesai
+        # satu bind texture per material; material tanpa texture pakai
+        # texture pertama, range berurutan dengan texture sama digabung
+        defaulttex = next(iter(self.materialtextures.values()), None)
+        self.drawranges = []
+        for name, start, count in materialranges:
+            texid = self.materialtextures.get(name, defaulttex)
+            if self.drawranges and self.drawranges[-1][0] == texid:
+                prevtex, prevstart, prevcount = self.drawranges[-1]
+                self.drawranges[-1] = (prevtex, prevstart, prevcount + count)
+            else:
+                self.drawranges.append((texid, start, count))
+
+        # cek error SETELAH upload buffer selesai
         err = glGetError()
         if err != GL_NO_ERROR:
-            print("[CubeRenderer] GL error after building display list:", err)
+            print("[CubeRenderer] GL error after building VBO:", err)
+
+    def buildmesharrays(
+        self,
+    ) -> tuple[np.ndarray, np.ndarray, list[tuple[str | None, int, int]]]:
+        """Segitiga hasil OBJLoader (diurutkan per material) jadi array
+        interleaved [x, y, z, nx, ny, nz, u, v] float32 + index uint32,
+        plus range (material, index awal, jumlah index) per material."""
+        # segitiga dengan material sama dibuat berdampingan
+        order = np.argsort(self.tri_materials, kind="stable")
+        tri_materials = self.tri_materials[order]
+
+        positions = self.vertices_np
+        texcoords = self.texcoords_np
+        tri_v = self.tri_indices[order].reshape(-1)
+        tri_uv = self.tri_uv_indices[order].reshape(-1)
+
+        vertexdata = np.zeros((tri_v.size, 8), dtype=np.float32)
+        vertexdata[:, 0:3] = positions[tri_v]
+        vertexdata[:, 3:6] = np.repeat(self.tri_normals[order], 3, axis=0)
+
+        # UV tidak valid / tidak ada -> (0, 0)
+        hasuv = (tri_uv >= 0) & (tri_uv < len(texcoords))
+        vertexdata[hasuv, 6:8] = texcoords[tri_uv[hasuv]]
+
+        # normal per-face -> vertex tidak bisa di-share, index jadi berurutan
+        indices = np.arange(tri_v.size, dtype=np.uint32)
+
+        mats, firsts, counts = np.unique(
+            tri_materials, return_index=True, return_counts=True
+        )
+        materialranges = [
+            (self.materialnames[m], 3 * first, 3 * count)
+            for m, first, count in zip(mats.tolist(), firsts.tolist(), counts.tolist())
+        ]
+        return vertexdata, indices, materialranges
 
     def draw(self) -> None:
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
@@ -221,7 +279,29 @@ class CubeRenderer:
         else:
             glDisable(GL_TEXTURE_2D)
 
-        if self.gllist is not None:
-            glCallList(self.gllist)
+        if self.vbo is not None and self.indexcount:
+            stride = 8 * 4  # 8 float32 per vertex
+            glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+            glEnableClientState(GL_VERTEX_ARRAY)
+            glEnableClientState(GL_NORMAL_ARRAY)
+            glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+            glVertexPointer(3, GL_FLOAT, stride, ctypes.c_void_p(0))
+            glNormalPointer(GL_FLOAT, stride, ctypes.c_void_p(3 * 4))
+            glTexCoordPointer(2, GL_FLOAT, stride, ctypes.c_void_p(6 * 4))
+
+            glColor3f(1.0, 1.0, 1.0)
+            for texid, start, count in self.drawranges:
+                if texid is not None:
+                    glBindTexture(GL_TEXTURE_2D, texid)
+                glDrawElements(
+                    GL_TRIANGLES, count, GL_UNSIGNED_INT, ctypes.c_void_p(start * 4)
+                )
+
+            glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+            glDisableClientState(GL_NORMAL_ARRAY)
+            glDisableClientState(GL_VERTEX_ARRAY)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
 
         glutSwapBuffers()
\ No newline at end of file
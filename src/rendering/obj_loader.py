@@ -1,28 +1,43 @@
+import io
+import mmap
 import os
+import traceback
+from functools import cached_property
 from typing import List, Tuple, Dict, Optional
 
+import numpy as np
+
+_NEWLINE = ord("\n")
+_INDENT = (ord(" "), ord("\t"))
+
 
 class OBJLoader:
     def __init__(self, path: str):
-        # posisi vertex
-        self.vertices: List[Tuple[float, float, float]] = []
-        # UV per-vertex
-        self.texcoords: List[Tuple[float, float]] = []
-        # tiap face: list indeks vertex (v0, v1, v2, ...)
-        self.faces: List[List[int]] = []
-        # tiap face: list indeks UV (sama panjang dengan faces[i]), -1 artinya tidak ada UV
-        self.facetexcoords: List[List[int]] = []
-        # warna per-face (fallback jika tidak ada tekstur)
-        self.facecolors: List[Tuple[float, float, float]] = []
-        # normal per-face
-        self.facenormals: List[Tuple[float, float, float]] = []
-        # nama material per-face
-        self.facematerials: List[Optional[str]] = []
         # materialname -> warna Kd
         self.mtlcolors: Dict[str, Tuple[float, float, float]] = {}
         # materialname -> path file tekstur (map_Kd)
         self.materialtexturepaths: Dict[str, str] = {}
 
+        # posisi vertex (N, 3) dan UV per-vertex (T, 2)
+        self.vertices_np: np.ndarray = np.zeros((0, 3), dtype=np.float32)
+        self.texcoords_np: np.ndarray = np.zeros((0, 2), dtype=np.float32)
+        # indeks vertex / UV semua face digabung (flat), dipotong per facecounts
+        self.facevertexidx: np.ndarray = np.zeros(0, dtype=np.int32)
+        self.facetexidx: np.ndarray = np.zeros(0, dtype=np.int32)
+        self.facecounts: np.ndarray = np.zeros(0, dtype=np.int32)
+        # normal per-face (F, 3)
+        self.facenormals_np: np.ndarray = np.zeros((0, 3), dtype=np.float32)
+        # nama material unik (indeks 0 = tanpa material) + indeksnya per face
+        self.materialnames: List[Optional[str]] = [None]
+        self.facematerialidx: np.ndarray = np.zeros(0, dtype=np.int32)
+
+        # hasil triangulasi (M segitiga): indeks vertex/UV (M, 3), normal (M, 3),
+        # indeks material (M,)
+        self.tri_indices: np.ndarray = np.zeros((0, 3), dtype=np.int32)
+        self.tri_uv_indices: np.ndarray = np.zeros((0, 3), dtype=np.int32)
+        self.tri_normals: np.ndarray = np.zeros((0, 3), dtype=np.float32)
+        self.tri_materials: np.ndarray = np.zeros(0, dtype=np.int32)
+
         # load OBJ + MTL
         self.load(path)
 
@@ -46,86 +61,225 @@ class OBJLoader:
 
     def load(self, path: str) -> None:
         basedir = os.path.dirname(path)
-        current_color: Tuple[float, float, float] = (0.8, 0.8, 0.8)
-        current_material: Optional[str] = None
-
-        with open(path, "r") as f:
-            lines = f.readlines()
-
-        # 1) cari dan load .mtl kalau ada
-        for line in lines:
-            line = line.strip()
-            if line.startswith("mtllib "):
-                _, mtlname = line.split(maxsplit=1)
-                mtlpath = os.path.join(basedir, mtlname)
-                self.loadmtl(mtlpath, basedir)
-                break
-
-        # 2) parse vertex, UV, dan face
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
 
-            # ganti material aktif
-            if line.startswith("usemtl "):
-                _, matname = line.split(maxsplit=1)
-                current_material = matname.strip()
-                current_color = self.mtlcolors.get(current_material, (0.8, 0.8, 0.8))
-
-            # vertex posisi
-            elif line.startswith("v "):
-                parts = line.split()
-                if len(parts) >= 4:
-                    x, y, z = parts[1:4]
-                    self.vertices.append((float(x), float(y), float(z)))
-
-            # UV koordinat
-            elif line.startswith("vt "):
-                parts = line.split()
-                if len(parts) >= 3:
-                    u, v = parts[1:3]
-                    self.texcoords.append((float(u), float(v)))
-
-            # face bisa 3,4,5,... vertex
-            elif line.startswith("f "):
-                parts = line.split()[1:]
-                vidx_list: List[int] = []
-                tidx_list: List[int] = []
-
-                for p in parts:
-                    # format umum: v / v/vt / v/vt/vn
-                    items = p.split("/")
-                    # index vertex (OBJ index mulai 1)
-                    vidx = int(items[0]) - 1
-                    vidx_list.append(vidx)
-
-                    # index UV kalau ada
-                    if len(items) >= 2 and items[1] != "":
-                        tidx = int(items[1]) - 1
-                        tidx_list.append(tidx)
-                    else:
-                        tidx_list.append(-1)  # tidak ada UV
-
-                if len(vidx_list) >= 3:
-                    self.faces.append(vidx_list)
-                    self.facetexcoords.append(tidx_list)
-                    self.facecolors.append(current_color)
-                    self.facematerials.append(current_material)
-
-                    # hitung normal dari 3 vertex pertama
-                    v0 = self.vertices[vidx_list[0]]
-                    v1 = self.vertices[vidx_list[1]]
-                    v2 = self.vertices[vidx_list[2]]
-                    nx, ny, nz = self.computenormal(v0, v1, v2)
-                    self.facenormals.append((nx, ny, nz))
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap tidak bisa untuk file kosong
+                self.parse(b"", basedir)
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    try:
+                        self.parse(data, basedir)
+                    except Exception as e:
+                        # view np.frombuffer di frame traceback masih pegang
+                        # buffer mmap -> close() gagal & error asli tertutup
+                        traceback.clear_frames(e.__traceback__)
+                        raise
 
         print(
-            f"[OBJLoader] loaded {len(self.vertices)} vertices, "
-            f"{len(self.faces)} faces, {len(self.mtlcolors)} materials, "
+            f"[OBJLoader] loaded {len(self.vertices_np)} vertices, "
+            f"{len(self.facecounts)} faces, {len(self.mtlcolors)} materials, "
             f"{len(self.materialtexturepaths)} texture paths"
         )
 
+    def parse(self, data, basedir: str) -> None:
+        """Parse isi OBJ (bytes / mmap) langsung di level byte pakai NumPy."""
+        buf = np.frombuffer(data, dtype=np.uint8)
+        if buf.size and buf[-1] != _NEWLINE:
+            buf = np.append(buf, np.uint8(_NEWLINE))
+
+        # batas tiap baris; awal baris digeser melewati spasi di depan (strip)
+        ends = np.flatnonzero(buf == _NEWLINE)
+        starts = np.concatenate(([0], ends[:-1] + 1))[: ends.size].astype(np.int64)
+        lead = np.flatnonzero(np.isin(buf[starts], _INDENT) & (starts < ends))
+        while lead.size:
+            starts[lead] += 1
+            lead = lead[np.isin(buf[starts[lead]], _INDENT) & (starts[lead] < ends[lead])]
+
+        tagged = self.classifylines(
+            buf, starts, ends, (b"mtllib ", b"v ", b"vt ", b"f ", b"usemtl ")
+        )
+
+        # 1) cari dan load .mtl kalau ada ("mtllib " tanpa nama dilewati)
+        for i in np.flatnonzero(tagged[b"mtllib "]).tolist():
+            parts = buf[starts[i]:ends[i]].tobytes().decode("utf-8").split(maxsplit=1)
+            if len(parts) < 2:
+                continue
+            mtlpath = os.path.join(basedir, parts[1].strip())
+            self.loadmtl(mtlpath, basedir)
+            break
+
+        # 2) vertex posisi + UV koordinat
+        vmask = tagged[b"v "]
+        self.vertices_np = self.parsefloats(self.gatherlines(buf, starts, ends, vmask, 2), 3)
+        vtmask = tagged[b"vt "]
+        self.texcoords_np = self.parsefloats(self.gatherlines(buf, starts, ends, vtmask, 3), 2)
+
+        # 3) face bisa 3,4,5,... vertex
+        fmask = tagged[b"f "]
+        vidx, tidx, counts = self.parsefaces(self.gatherlines(buf, starts, ends, fmask, 2))
+        faceoffsets = starts[fmask]
+
+        # face dengan < 3 vertex dibuang
+        keep = counts >= 3
+        cornerkeep = np.repeat(keep, counts)
+        self.facevertexidx = vidx[cornerkeep]
+        self.facetexidx = tidx[cornerkeep]
+        self.facecounts = counts[keep]
+        faceoffsets = faceoffsets[keep]
+
+        # 4) material aktif tiap face = usemtl terakhir sebelum face tsb
+        materialidx: Dict[Optional[str], int] = {None: 0}
+        usemtlidx: List[int] = [0]
+        mtloffsets: List[int] = []
+        for i in np.flatnonzero(tagged[b"usemtl "]).tolist():
+            parts = buf[starts[i]:ends[i]].tobytes().decode("utf-8").split(maxsplit=1)
+            if len(parts) < 2:
+                # "usemtl " tanpa nama dilewati, material sebelumnya tetap aktif
+                continue
+            name = parts[1].strip()
+            usemtlidx.append(materialidx.setdefault(name, len(materialidx)))
+            mtloffsets.append(int(starts[i]))
+        matidx = np.searchsorted(
+            np.asarray(mtloffsets, dtype=np.int64), faceoffsets, side="right"
+        )
+        self.materialnames = list(materialidx)
+        self.facematerialidx = np.asarray(usemtlidx, dtype=np.int32)[matidx]
+
+        # hitung normal dari 3 vertex pertama (sekaligus semua face)
+        self.facenormals_np = self.computefacenormals()
+
+        # 5) fan-triangulasi sekali di sini, renderer tinggal upload
+        faceid, corners = self.fantriangulate(self.facecounts)
+        self.tri_indices = self.facevertexidx[corners]
+        self.tri_uv_indices = self.facetexidx[corners]
+        self.tri_normals = self.facenormals_np[faceid]
+        self.tri_materials = self.facematerialidx[faceid]
+
+    @staticmethod
+    def classifylines(
+        buf: np.ndarray, starts: np.ndarray, ends: np.ndarray, prefixes: Tuple[bytes, ...]
+    ) -> Dict[bytes, np.ndarray]:
+        """Sekali jalan: mask baris untuk tiap prefix (mis. b"v ", b"mtllib ")."""
+        # byte pertama & panjang baris cukup dibaca sekali untuk semua prefix
+        first = buf[starts]
+        linelen = ends - starts
+        masks: Dict[bytes, np.ndarray] = {}
+        for prefix in prefixes:
+            pattern = np.frombuffer(prefix, dtype=np.uint8)
+            # sisa byte prefix hanya dicek untuk kandidat
+            cand = np.flatnonzero(first == pattern[0])
+            cand = cand[linelen[cand] >= len(prefix)]
+            for offset in range(1, len(prefix)):
+                cand = cand[buf[starts[cand] + offset] == pattern[offset]]
+            mask = np.zeros(starts.size, dtype=bool)
+            mask[cand] = True
+            masks[prefix] = mask
+        return masks
+
+    @staticmethod
+    def gatherlines(
+        buf: np.ndarray, starts: np.ndarray, ends: np.ndarray, mask: np.ndarray, skip: int
+    ) -> bytes:
+        """Gabung baris terpilih jadi satu bytes (dipisah newline), tag sepanjang
+        skip di awal tiap baris diganti spasi."""
+        sel = np.flatnonzero(mask)
+        if not sel.size:
+            return b""
+
+        # baris terpilih yang berurutan disalin sebagai satu potongan
+        brk = np.flatnonzero(np.diff(sel) != 1) + 1
+        first = sel[np.concatenate(([0], brk))]
+        last = sel[np.concatenate((brk - 1, [sel.size - 1]))]
+        lo = np.concatenate(([0], ends[:-1] + 1))[first]
+        hi = ends[last] + 1  # ikut newline-nya
+        out = np.concatenate([buf[a:b] for a, b in zip(lo.tolist(), hi.tolist())])
+
+        # posisi tag tiap baris di dalam out
+        runid = np.repeat(np.arange(first.size), last - first + 1)
+        runoffset = np.cumsum(hi - lo) - (hi - lo)
+        tagpos = starts[sel] - lo[runid] + runoffset[runid]
+        for k in range(skip):
+            out[tagpos + k] = ord(" ")
+        return out.tobytes()
+
+    @staticmethod
+    def parsefloats(text: bytes, ncols: int) -> np.ndarray:
+        """Baris angka (tanpa tag) -> array float32 (N, ncols). Baris yang
+        kurang kolom (mis. "vt 0.5") diisi 0 untuk kolom yang hilang."""
+        if not text:
+            return np.zeros((0, ncols), dtype=np.float32)
+        try:
+            return np.loadtxt(
+                io.BytesIO(text),
+                dtype=np.float32,
+                usecols=range(ncols),
+                ndmin=2,
+                comments="#",
+            )
+        except ValueError:
+            pass
+
+        # ada baris pendek: parse per baris (angka tidak valid tetap ValueError)
+        lines = text.split(b"\n")[:-1]
+        out = np.zeros((len(lines), ncols), dtype=np.float32)
+        for i, line in enumerate(lines):
+            values = line.split(b"#", 1)[0].split()[:ncols]
+            out[i, : len(values)] = [float(v) for v in values]
+        return out
+
+    @staticmethod
+    def parsefaces(text: bytes) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Baris face (tanpa tag 'f') -> (indeks vertex flat, indeks UV flat,
+        jumlah vertex per face). Indeks mulai 0, UV -1 artinya tidak ada."""
+        if not text:
+            empty = np.zeros(0, dtype=np.int32)
+            return empty, empty.copy(), empty.copy()
+
+        # buang komentar di belakang face ("f 1 2 3 # ...")
+        if b"#" in text:
+            text = b"\n".join(line.split(b"#", 1)[0] for line in text.split(b"\n"))
+
+        # "v//vn" -> "v/0/vn" supaya UV kosong tetap punya slot (0 - 1 = -1)
+        text = text.replace(b"//", b"/0/")
+        chars = np.frombuffer(text, dtype=np.uint8)
+        blank = chars <= ord(" ")  # spasi, tab, \r, \n
+        starts = np.flatnonzero(~blank & np.concatenate(([True], blank[:-1])))
+        newlines = np.flatnonzero(chars == _NEWLINE)
+        ntok = starts.size
+
+        # jumlah vertex per face = jumlah token per baris
+        counts = np.diff(np.searchsorted(starts, newlines), prepend=0).astype(np.int32)
+
+        # jumlah "/" per token harus sama supaya bisa di-reshape langsung
+        slashtok = np.searchsorted(starts, np.flatnonzero(chars == ord("/")), side="right") - 1
+        slashes = np.bincount(slashtok, minlength=ntok)
+
+        values = None
+        if ntok and (slashes == slashes[0]).all():
+            values = np.fromstring(text.replace(b"/", b" "), dtype=np.int64, sep=" ")
+            # slot kosong di akhir ("1/1/") bikin jumlah angka tidak pas
+            if values.size != ntok * (int(slashes[0]) + 1):
+                values = None
+
+        if values is not None:
+            # format umum: v / v/vt / v/vt/vn (OBJ index mulai 1)
+            values = values.reshape(ntok, int(slashes[0]) + 1)
+            vidx = values[:, 0].astype(np.int32) - 1
+            if values.shape[1] >= 2:
+                tidx = values[:, 1].astype(np.int32) - 1
+            else:
+                tidx = np.full(ntok, -1, dtype=np.int32)  # tidak ada UV
+            return vidx, tidx, counts
+
+        # format campur / slot kosong: pecah token satu-satu
+        tokens = np.array(text.split())
+        head = np.char.partition(tokens, b"/")
+        vidx = head[:, 0].astype(np.int32) - 1
+        uv = np.char.partition(head[:, 2], b"/")[:, 0]
+        tidx = np.where(uv == b"", b"0", uv).astype(np.int32) - 1
+        return vidx, tidx, counts
+
     def loadmtl(self, mtlpath: str, basedir: str) -> None:
         if not os.path.exists(mtlpath):
             print(f"[OBJLoader] MTL not found: {mtlpath}")
@@ -133,64 +287,116 @@ class OBJLoader:
 
         current_name: Optional[str] = None
 
+        def newmtl(rest: str) -> None:
+            nonlocal current_name
+            name = rest.strip()
+            # "newmtl" tanpa nama dilewati, material sebelumnya tetap aktif
+            if name:
+                current_name = name
+
+        def kd(rest: str) -> None:
+            parts = rest.split()
+            if len(parts) >= 3 and current_name is not None:
+                r, g, b = parts[0:3]
+                self.mtlcolors[current_name] = (float(r), float(g), float(b))
+
+        def mapkd(rest: str) -> None:
+            parts = rest.split()
+            if len(parts) >= 1 and current_name is not None:
+                texname = parts[0]
+                texpath = os.path.join(basedir, texname)
+                self.materialtexturepaths[current_name] = texpath
+
+        # tag -> handler, satu lookup dict per baris
+        handlers = {"newmtl": newmtl, "Kd": kd, "map_Kd": mapkd}
+
         with open(mtlpath, "r") as f:
             for line in f:
                 line = line.strip()
-                if not line or line.startswith("#"):
+                if not line or line[0] == "#":
                     continue
 
-                if line.startswith("newmtl "):
-                    _, name = line.split(maxsplit=1)
-                    current_name = name.strip()
-
-                elif line.startswith("Kd ") and current_name is not None:
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        r, g, b = parts[1:4]
-                        self.mtlcolors[current_name] = (
-                            float(r),
-                            float(g),
-                            float(b),
-                        )
-
-                elif line.startswith("map_Kd ") and current_name is not None:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        texname = parts[1]
-                        texpath = os.path.join(basedir, texname)
-                        self.materialtexturepaths[current_name] = texpath
+                tag, _, rest = line.partition(" ")
+                handler = handlers.get(tag)
+                if handler is not None:
+                    handler(rest)
 
         print(
             f"[OBJLoader] loaded {len(self.mtlcolors)} mtl colors, "
             f"{len(self.materialtexturepaths)} texture paths from {mtlpath}"
         )
 
+    # ---------- VERSI LIST (dibuat saat pertama diakses) ----------
+    @cached_property
+    def vertices(self) -> List[Tuple[float, float, float]]:
+        return list(map(tuple, self.vertices_np.tolist()))
+
+    @cached_property
+    def texcoords(self) -> List[Tuple[float, float]]:
+        return list(map(tuple, self.texcoords_np.tolist()))
+
+    @cached_property
+    def faces(self) -> List[List[int]]:
+        """Tiap face: list indeks vertex (v0, v1, v2, ...)."""
+        return self.splitperface(self.facevertexidx)
+
+    @cached_property
+    def facetexcoords(self) -> List[List[int]]:
+        """Tiap face: list indeks UV, -1 artinya tidak ada UV."""
+        return self.splitperface(self.facetexidx)
+
+    @cached_property
+    def facenormals(self) -> List[Tuple[float, float, float]]:
+        return list(map(tuple, self.facenormals_np.tolist()))
+
+    @cached_property
+    def facematerials(self) -> List[Optional[str]]:
+        return [self.materialnames[i] for i in self.facematerialidx.tolist()]
+
+    @cached_property
+    def facecolors(self) -> List[Tuple[float, float, float]]:
+        """Warna Kd per-face (fallback jika tidak ada tekstur)."""
+        default = (0.8, 0.8, 0.8)
+        colors = [self.mtlcolors.get(name, default) if name is not None else default
+                  for name in self.materialnames]
+        return [colors[i] for i in self.facematerialidx.tolist()]
+
+    def splitperface(self, flat: np.ndarray) -> List[List[int]]:
+        faceends = np.cumsum(self.facecounts).tolist()
+        facestarts = [0] + faceends[:-1]
+        values = flat.tolist()
+        return [values[a:b] for a, b in zip(facestarts, faceends)]
+
     # ---------- UTILITAS ----------
-    def computenormal(
-        self,
-        v0: Tuple[float, float, float],
-        v1: Tuple[float, float, float],
-        v2: Tuple[float, float, float],
-    ) -> Tuple[float, float, float]:
-        """Normal face dari tiga titik v0,v1,v2."""
-        x1, y1, z1 = v1[0] - v0[0], v1[1] - v0[1], v1[2] - v0[2]
-        x2, y2, z2 = v2[0] - v0[0], v2[1] - v0[1], v2[2] - v0[2]
-
-        nx = y1 * z2 - z1 * y2
-        ny = z1 * x2 - x1 * z2
-        nz = x1 * y2 - y1 * x2
-
-        length = (nx * nx + ny * ny + nz * nz) ** 0.5
-        if length == 0.0:
-            return (0.0, 0.0, 1.0)
-        return (nx / length, ny / length, nz / length)
+    @staticmethod
+    def fantriangulate(facecounts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Fan (v0, v[i], v[i+1]) untuk face dengan jumlah vertex facecounts.
+        Hasil: indeks face per segitiga (M,) dan posisi corner di array
+        flat per face (M, 3)."""
+        facecounts = np.asarray(facecounts, dtype=np.int64)
+        ntri = np.maximum(facecounts - 2, 0)
+        faceid = np.repeat(np.arange(facecounts.size), ntri)
+        # i = 1 .. n-2 di dalam tiap face
+        i = np.arange(faceid.size) - np.repeat(np.cumsum(ntri) - ntri, ntri) + 1
+        base = (np.cumsum(facecounts) - facecounts)[faceid]
+        corners = np.stack((base, base + i, base + i + 1), axis=1)
+        return faceid, corners
+
+    def computefacenormals(self) -> np.ndarray:
+        """Normal semua face dari tiga vertex pertamanya, hasil (F, 3)."""
+        firsts = np.cumsum(self.facecounts) - self.facecounts
+        corners = self.facevertexidx[firsts[:, None] + np.arange(3)]
+        tri = self.vertices_np[corners].astype(np.float64)  # (F, 3, 3)
+
+        n = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+        length = np.linalg.norm(n, axis=1, keepdims=True)
+        # face degenerate -> (0, 0, 1)
+        n = np.where(length > 0.0, n / np.where(length > 0.0, length, 1.0), (0.0, 0.0, 1.0))
+        return n.astype(np.float32)
 
     def computecentroid(self) -> Tuple[float, float, float]:
         """Titik tengah (centroid) semua vertex."""
-        if not self.vertices:
+        if not len(self.vertices_np):
             return (0.0, 0.0, 0.0)
-        sx = sum(v[0] for v in self.vertices)
-        sy = sum(v[1] for v in self.vertices)
-        sz = sum(v[2] for v in self.vertices)
-        n = len(self.vertices)
-        return (sx / n, sy / n, sz / n)
+        cx, cy, cz = self.vertices_np.mean(axis=0, dtype=np.float64).tolist()
+        return (cx, cy, cz)
@@ -0,0 +1,23 @@
+import os
+
+from src.rendering.cube_renderer import CubeRenderer
+
+MODELS = os.path.join(os.path.dirname(__file__), os.pardir, "models")
+
+
+def test_material_ranges_of_multi_material_model():
+    cube = CubeRenderer(obj_path=os.path.join(MODELS, "Lowpoly_tree_sample.obj"))
+    vertexdata, indices, materialranges = cube.buildmesharrays()
+
+    assert materialranges == [("Bark", 0, 1140), ("Tree", 1140, 360)]
+    assert indices.tolist() == list(range(1500))
+    assert vertexdata.shape == (1500, 8)
+
+
+def test_fallback_cube_is_one_range():
+    cube = CubeRenderer()
+    vertexdata, indices, materialranges = cube.buildmesharrays()
+
+    # 6 quad -> 12 segitiga -> 36 index, semua tanpa material
+    assert materialranges == [(None, 0, 36)]
+    assert vertexdata.shape == (36, 8)
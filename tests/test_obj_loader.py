@@ -0,0 +1,119 @@
+import pytest
+
+from src.rendering.obj_loader import OBJLoader
+
+
+def load(tmp_path, content: bytes) -> OBJLoader:
+    path = tmp_path / "mesh.obj"
+    path.write_bytes(content)
+    return OBJLoader(str(path))
+
+
+def test_parse_error_is_not_masked_by_mmap_close(tmp_path):
+    with pytest.raises(ValueError):
+        load(tmp_path, b"v 0 0 0\nv a b c\n")
+
+
+def test_short_texcoord_row_is_padded(tmp_path):
+    loader = load(tmp_path, b"v 0 0 0\nvt 0.5\nvt 0.25 0.75\n")
+    assert loader.texcoords_np.tolist() == [[0.5, 0.0], [0.25, 0.75]]
+
+
+def test_short_vertex_row_is_padded(tmp_path):
+    loader = load(tmp_path, b"v 1 2\nv 1 2 3\n")
+    assert loader.vertices_np.tolist() == [[1.0, 2.0, 0.0], [1.0, 2.0, 3.0]]
+
+
+def test_face_with_trailing_slash(tmp_path):
+    loader = load(
+        tmp_path, b"v 0 0 0\nv 1 0 0\nv 0 1 0\nvt 0 0\nf 1/1/ 2/1/ 3/1/\n"
+    )
+    assert loader.facevertexidx.tolist() == [0, 1, 2]
+    assert loader.facetexidx.tolist() == [0, 0, 0]
+    assert loader.facecounts.tolist() == [3]
+
+
+def test_comment_after_face(tmp_path):
+    loader = load(tmp_path, b"v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3 # tri\n")
+    assert loader.facevertexidx.tolist() == [0, 1, 2]
+    assert loader.facecounts.tolist() == [3]
+
+
+def test_blank_usemtl_keeps_previous_material(tmp_path):
+    loader = load(
+        tmp_path,
+        b"v 0 0 0\nv 1 0 0\nv 0 1 0\n"
+        b"usemtl red\nf 1 2 3\nusemtl \nf 1 2 3\n",
+    )
+    assert loader.facecounts.tolist() == [3, 3]
+    assert loader.materialnames == [None, "red"]
+    assert loader.facematerialidx.tolist() == [1, 1]
+
+
+def test_blank_mtllib_is_skipped(tmp_path):
+    loader = load(tmp_path, b"mtllib \nv 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n")
+    assert loader.facecounts.tolist() == [3]
+    assert loader.mtlcolors == {}
+
+
+# 8 vertex + 8 UV, cukup untuk quad + pentagon
+VERTS = b"".join(b"v %d 0 0\n" % i for i in range(8))
+UVS = b"".join(b"vt %d 0\n" % i for i in range(8))
+TRI = b"v 0 0 0\nv 1 0 0\nv 0 1 0\n"
+
+
+def test_fan_triangulation_of_quad_and_pentagon(tmp_path):
+    # UV sengaja dibalik supaya corner UV terbedakan dari corner vertex
+    loader = load(
+        tmp_path,
+        VERTS + UVS + b"f 1/8 2/7 3/6 4/5\nf 4/5 5/4 6/3 7/2 8/1\n",
+    )
+    assert loader.tri_indices.tolist() == [
+        [0, 1, 2], [0, 2, 3],
+        [3, 4, 5], [3, 5, 6], [3, 6, 7],
+    ]
+    # UV ikut corner fan yang sama (0, i, i+1)
+    assert loader.tri_uv_indices.tolist() == [
+        [7, 6, 5], [7, 5, 4],
+        [4, 3, 2], [4, 2, 1], [4, 1, 0],
+    ]
+
+
+def test_material_before_first_usemtl_and_reused(tmp_path):
+    loader = load(
+        tmp_path,
+        TRI + b"f 1 2 3\n"
+        b"usemtl a\nf 1 2 3\n"
+        b"usemtl b\nf 1 2 3\n"
+        b"usemtl a\nf 1 2 3 3\n",
+    )
+    assert loader.materialnames == [None, "a", "b"]
+    assert loader.facematerialidx.tolist() == [0, 1, 2, 1]
+    assert loader.tri_materials.tolist() == [0, 1, 2, 1, 1]
+
+
+def test_dropped_face_does_not_shift_materials(tmp_path):
+    loader = load(
+        tmp_path,
+        TRI + b"usemtl a\nf 1 2 3\nf 1 2\n"
+        b"usemtl b\nf 1 2\nf 1 2 3\n",
+    )
+    assert loader.facecounts.tolist() == [3, 3]
+    assert loader.facematerialidx.tolist() == [1, 2]
+    assert loader.tri_materials.tolist() == [1, 2]
+
+
+def test_degenerate_face_normal_defaults_to_z(tmp_path):
+    # face pertama: tiga vertex segaris -> luas nol; face kedua di bidang xz
+    loader = load(
+        tmp_path,
+        b"v 0 0 0\nv 1 0 0\nv 2 0 0\nv 0 0 1\nf 1 2 3\nf 1 4 2\n",
+    )
+    assert loader.facenormals_np.tolist() == [[0.0, 0.0, 1.0], [0.0, 1.0, 0.0]]
+    assert loader.tri_normals.tolist() == [[0.0, 0.0, 1.0], [0.0, 1.0, 0.0]]
+
+
+def test_bare_newmtl_keeps_previous_material(tmp_path):
+    (tmp_path / "mesh.mtl").write_text("newmtl a\nKd 1 0 0\nnewmtl\nKd 0 1 0\n")
+    loader = load(tmp_path, b"mtllib mesh.mtl\n" + TRI + b"usemtl a\nf 1 2 3\n")
+    assert loader.mtlcolors == {"a": (0.0, 1.0, 0.0)}